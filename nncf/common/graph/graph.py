@@ -520,6 +520,39 @@ class NNCFGraph:
         :param dtype: The data type of the tensor.
         :param parallel_input_port_ids: Input ports for parallel edges, if any should be present for this edge.
         """
+        from_node_key, to_node_key, attrs = self._get_checked_edge_attributes(
+            from_node_id, to_node_id, tensor_shape, input_port_id, output_port_id, dtype, parallel_input_port_ids
+        )
+        self._nx_graph.add_edge(from_node_key, to_node_key, **attrs)
+
+    def add_edges_between_nncf_nodes(
+        self, edges: List[Tuple[int, int, List[int], int, int, Dtype, Optional[List[int]]]]
+    ) -> None:
+        """
+        Adds a batch of directed edges between `NNCFNode`s that are already present in the graph.
+        Equivalent to calling `NNCFGraph.add_edge_between_nncf_nodes` for each edge, but inserts all edges
+        into the underlying graph at once.
+        :param edges: Edge descriptions, each being a tuple of (from_node_id, to_node_id, tensor_shape,
+            input_port_id, output_port_id, dtype, parallel_input_port_ids) with the same meaning as the
+            corresponding arguments of `NNCFGraph.add_edge_between_nncf_nodes`.
+        """
+        get_checked_edge_attributes = self._get_checked_edge_attributes
+        self._nx_graph.add_edges_from([get_checked_edge_attributes(*edge) for edge in edges])
+
+    def _get_checked_edge_attributes(
+        self,
+        from_node_id: int,
+        to_node_id: int,
+        tensor_shape: List[int],
+        input_port_id: int,
+        output_port_id: int,
+        dtype: Dtype,
+        parallel_input_port_ids: Optional[List[int]] = None,
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Checks that an edge between the given nodes can be added into the graph and builds its attributes.
+        :return: A tuple of the from-node key, the to-node key and the edge attributes.
+        """
         from_node_key = self._node_id_to_key_dict[from_node_id]
         to_node_key = self._node_id_to_key_dict[to_node_id]
 
@@ -544,7 +577,7 @@ class NNCFGraph:
             NNCFGraph.DTYPE_EDGE_ATTR: dtype,
             NNCFGraph.PARALLEL_INPUT_PORT_IDS_ATTR: [] if parallel_input_port_ids is None else parallel_input_port_ids,
         }
-        self._nx_graph.add_edge(from_node_key, to_node_key, **attrs)
+        return from_node_key, to_node_key, attrs
 
     def topological_sort(self) -> List[NNCFNode]:
         """
@@ -13,7 +13,7 @@ from abc import abstractmethod
 from collections import OrderedDict
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Type
+from typing import Any, Dict, List, Optional, Sequence, Set, Type
 
 import jstyleson as json
 
@@ -74,7 +74,7 @@ class HWConfig(list, ABC):
         self.target_device = None
 
     @abstractmethod
-    def _get_available_operator_metatypes_for_matching(self) -> List[Type[OperatorMetatype]]:
+    def _get_available_operator_metatypes_for_matching(self) -> Sequence[Type[OperatorMetatype]]:
         pass
 
     @staticmethod
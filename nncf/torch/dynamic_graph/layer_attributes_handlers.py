@@ -9,6 +9,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import List, Optional
+
 from torch.nn import Conv1d
 from torch.nn import Conv2d
 from torch.nn import Conv3d
@@ -19,6 +21,7 @@ from torch.nn import Linear
 from torch.nn import Module as TorchModule
 
 from nncf.common.graph.graph import NNCFGraph
+from nncf.common.graph.graph import NNCFNode
 from nncf.common.graph.layer_attributes import BaseLayerAttributes
 from nncf.common.graph.layer_attributes import ConvolutionLayerAttributes
 from nncf.common.graph.layer_attributes import GenericWeightedLayerAttributes
@@ -53,6 +56,11 @@ OP_NAMES_REQUIRING_ATTRS_FROM_ARGS_KWARGS = list(
     TRANSPOSE_OP_NAMES + PERMUTE_OP_NAMES + GETITEM_OP_NAMES + PAD_OP_NAMES
 )
 
+CAT_METATYPES = [PTCatMetatype]
+RESHAPE_METATYPES = [PTReshapeMetatype, PTSqueezeMetatype]
+SPLIT_METATYPES = [PTSplitMetatype]
+METATYPES_REQUIRING_ATTRS_FROM_EDGES = frozenset(CAT_METATYPES + RESHAPE_METATYPES + SPLIT_METATYPES)
+
 
 def get_layer_attributes_from_module(module: TorchModule, operator_name: str) -> BaseLayerAttributes:
     if operator_name == "group_norm":
@@ -122,9 +130,22 @@ def get_layer_attributes_from_args_and_kwargs(op_name: str, args, kwargs) -> Bas
     return layer_attrs
 
 
-def set_nodes_attributes_in_nncf_graph(graph: NNCFGraph) -> None:
-    for node in graph.get_all_nodes():
-        if node.metatype is PTCatMetatype:
+def set_nodes_attributes_in_nncf_graph(graph: NNCFGraph, nodes: Optional[List[NNCFNode]] = None) -> None:
+    """
+    Sets the layer attributes that can only be derived from the input and output edges of a node.
+    Only the nodes with metatypes from METATYPES_REQUIRING_ATTRS_FROM_EDGES are processed, so a metatype
+    handled here must be added to it - graph building relies on that set to select the nodes to pass in.
+
+    :param graph: NNCFGraph with all edges already added.
+    :param nodes: Nodes of the graph to process. If not specified, all nodes of the graph are processed.
+    """
+    if nodes is None:
+        nodes = graph.get_all_nodes()
+    for node in nodes:
+        if node.metatype not in METATYPES_REQUIRING_ATTRS_FROM_EDGES:
+            continue
+
+        if node.metatype in CAT_METATYPES:
             input_edges = graph.get_input_edges(node)
             output_edges = graph.get_output_edges(node)
             # Case of intermediate node
@@ -138,7 +159,7 @@ def set_nodes_attributes_in_nncf_graph(graph: NNCFGraph) -> None:
                 layer_attributes = MultipleInputLayerAttributes(axis)
                 node.layer_attributes = layer_attributes
 
-        if node.metatype in [PTReshapeMetatype, PTSqueezeMetatype]:
+        if node.metatype in RESHAPE_METATYPES:
             input_nodes = graph.get_input_edges(node)
             output_nodes = graph.get_output_edges(node)
             # In case ReshapeMetatype op is intermediate node
@@ -146,7 +167,7 @@ def set_nodes_attributes_in_nncf_graph(graph: NNCFGraph) -> None:
                 layer_attributes = ReshapeLayerAttributes(input_nodes[0].tensor_shape, output_nodes[0].tensor_shape)
                 node.layer_attributes = layer_attributes
 
-        if node.metatype is PTSplitMetatype:
+        if node.metatype in SPLIT_METATYPES:
             input_edges = graph.get_input_edges(node)
             output_edges = graph.get_output_edges(node)
             if input_edges and output_edges:
@@ -8,12 +8,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import sys
+
 from nncf.torch.dynamic_graph.scope import Scope
 
 
 class OperationAddress:
     def __init__(self, operator_name: str, scope_in_model: Scope, call_order: int):
-        self.operator_name = operator_name
+        # Operator names are used as keys for metatype lookups and are shared by many addresses
+        self.operator_name = sys.intern(operator_name)
         self.scope_in_model = scope_in_model
         self.call_order = call_order
 
@@ -8,18 +8,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from collections import defaultdict
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Type
 
 import torch
 
 from nncf.common.graph.operator_metatypes import INPUT_NOOP_METATYPES
+from nncf.common.graph.operator_metatypes import OperatorMetatype
 from nncf.torch.dynamic_graph.context import TracingContext
 from nncf.torch.dynamic_graph.graph import DynamicGraph
 from nncf.torch.dynamic_graph.graph_tracer import GraphTracer
 from nncf.torch.dynamic_graph.graph_tracer import ModelInputInfo
+from nncf.torch.dynamic_graph.layer_attributes_handlers import METATYPES_REQUIRING_ATTRS_FROM_EDGES
 from nncf.torch.dynamic_graph.layer_attributes_handlers import set_nodes_attributes_in_nncf_graph
-from nncf.torch.dynamic_graph.scope import Scope
 from nncf.torch.graph.graph import PTNNCFGraph
 from nncf.torch.graph.operator_metatypes import PT_OPERATOR_METATYPES
 
@@ -27,6 +27,7 @@ from nncf.torch.graph.operator_metatypes import PT_OPERATOR_METATYPES
 class GraphBuilder:
     def __init__(self, custom_forward_fn: Callable[[torch.nn.Module], Any]):
         self.custom_forward_fn = custom_forward_fn
+        self._tracer = GraphTracer(custom_forward_fn)
 
     def build_graph(
         self,
@@ -35,70 +36,122 @@ class GraphBuilder:
         as_eval: bool = False,
         input_infos: List[ModelInputInfo] = None,
     ) -> PTNNCFGraph:
-        tracer = GraphTracer(self.custom_forward_fn)
-        dynamic_graph = tracer.trace_graph(model, context_to_use, as_eval)
-        return GraphConverter.convert(dynamic_graph, input_infos)
+        dynamic_graph = self._tracer.trace_graph(model, context_to_use, as_eval)
+        return convert_dynamic_graph_to_nncf_graph(dynamic_graph, input_infos)
 
 
-class GraphConverter:
-    @staticmethod
-    def convert(dynamic_graph: DynamicGraph, input_infos: List[ModelInputInfo] = None) -> PTNNCFGraph:
-        module_id_vs_known_op_addrs_map: Dict[int, Set[Scope]] = defaultdict(set)
-        for dynamic_graph_node in dynamic_graph.get_all_nodes():
-            module_id_vs_known_op_addrs_map[dynamic_graph_node.calling_module_id].add(
-                dynamic_graph_node.op_exec_context.op_address
-            )
+def convert_dynamic_graph_to_nncf_graph(
+    dynamic_graph: DynamicGraph, input_infos: List[ModelInputInfo] = None
+) -> PTNNCFGraph:
+    """
+    Builds the PTNNCFGraph corresponding to the traced DynamicGraph.
 
-        module_id_vs_sorted_scopes_map = {
-            k: list(sorted([s.scope_in_model for s in v], key=str)) for k, v in module_id_vs_known_op_addrs_map.items()
-        }
-
-        nncf_graph = PTNNCFGraph()
-        for dynamic_graph_node in dynamic_graph.get_all_nodes():
-            op_address = dynamic_graph_node.op_exec_context.op_address
-
-            metatype = PT_OPERATOR_METATYPES.get_operator_metatype_by_op_name(op_address.operator_name)
-            if metatype.get_subtypes():
-                subtype = metatype.determine_subtype(
-                    dynamic_graph_node.layer_attributes, functions_kwargs=dynamic_graph_node.__dict__
-                )
-            else:
-                subtype = None
-            if subtype is not None:
-                metatype = subtype
-
-            is_integer_input = False
-            if metatype in INPUT_NOOP_METATYPES and input_infos is not None:
-                input_id = op_address.call_order
-                if input_infos[input_id].is_integer_input():
-                    is_integer_input = True
-
-            is_shared = len(module_id_vs_sorted_scopes_map[dynamic_graph_node.calling_module_id]) > 1
-            canonical_scope = module_id_vs_sorted_scopes_map[dynamic_graph_node.calling_module_id][0]
-
-            nncf_graph.add_nncf_node(
-                node_name=str(op_address),
-                node_type=op_address.operator_name,
-                node_metatype=metatype,
-                layer_attributes=dynamic_graph_node.layer_attributes,
-                node_id_override=dynamic_graph_node.node_id,
-                layer_name=str(canonical_scope),
-                ignored_algorithms=dynamic_graph_node.ignored_algorithms,
-                is_in_iteration_scope=dynamic_graph_node.is_in_iteration_scope,
-                is_integer_input=is_integer_input,
-                is_shared=is_shared,
-            )
+    :param dynamic_graph: The traced dynamic graph of the model.
+    :param input_infos: Descriptions of the model inputs, used to mark integer input nodes.
+    :return: The resulting PTNNCFGraph.
+    """
+    # DynamicGraph.get_all_nodes() builds a fresh DynamicGraphNode for each underlying nx node,
+    # so the node list is materialized once and shared by both passes below.
+    dynamic_graph_nodes = dynamic_graph.get_all_nodes()
+    # Only the lexicographically smallest scope string (the canonical layer name) and the number of
+    # distinct operation addresses (to detect shared modules) are needed per module, so both are
+    # tracked incrementally instead of sorting every module's scopes. Operation addresses are tracked
+    # by their string form, which is computed once per node and reused as the NNCF node name.
+    node_names: List[str] = []
+    module_id_vs_known_op_addrs_map: Dict[int, Set[str]] = {}
+    module_id_vs_canonical_scope_str_map: Dict[int, str] = {}
+    for dynamic_graph_node in dynamic_graph_nodes:
+        module_id = dynamic_graph_node.calling_module_id
+        op_address = dynamic_graph_node.op_exec_context.op_address
+        node_name = str(op_address)
+        node_names.append(node_name)
+        known_op_addrs = module_id_vs_known_op_addrs_map.get(module_id)
+        if known_op_addrs is None:
+            known_op_addrs = set()
+            module_id_vs_known_op_addrs_map[module_id] = known_op_addrs
+        elif node_name in known_op_addrs:
+            continue
+        known_op_addrs.add(node_name)
+        scope_str = str(op_address.scope_in_model)
+        canonical_scope_str = module_id_vs_canonical_scope_str_map.get(module_id)
+        if canonical_scope_str is None or scope_str < canonical_scope_str:
+            module_id_vs_canonical_scope_str_map[module_id] = scope_str
+
+    # Operator names repeat heavily across the graph, so the registry is queried once per distinct name
+    op_name_vs_metatype_map: Dict[str, Type[OperatorMetatype]] = {}
+    # Registry membership checks scan the registered values, so a set snapshot is used in the loop
+    input_noop_metatypes = frozenset(INPUT_NOOP_METATYPES.values())
+    metatypes_with_subtypes = PT_OPERATOR_METATYPES.get_metatypes_with_subtypes()
+    integer_input_flags = None
+    if input_infos is not None:
+        integer_input_flags = [input_info.is_integer_input() for input_info in input_infos]
+    nncf_graph = PTNNCFGraph()
+    add_nncf_node = nncf_graph.add_nncf_node
+    # Some layer attributes are derived from the node's edges, so they are set once all edges are added -
+    # only for the nodes that need them rather than by re-traversing the whole graph.
+    nodes_requiring_attrs_from_edges = []
+    for dynamic_graph_node, node_name in zip(dynamic_graph_nodes, node_names):
+        op_address = dynamic_graph_node.op_exec_context.op_address
+        op_name = op_address.operator_name
+        layer_attributes = dynamic_graph_node.layer_attributes
+        module_id = dynamic_graph_node.calling_module_id
+
+        metatype = op_name_vs_metatype_map.get(op_name)
+        if metatype is None:
+            metatype = PT_OPERATOR_METATYPES.get_operator_metatype_by_op_name(op_name)
+            op_name_vs_metatype_map[op_name] = metatype
+        if metatype in metatypes_with_subtypes:
+            # Subtype matchers only inspect the layer attributes and whether the operation was called
+            # inside an NNCF module.
+            functions_kwargs = {
+                DynamicGraph.IS_CALLED_INSIDE_NNCF_MODULE: dynamic_graph_node.is_called_inside_nncf_module
+            }
+            subtype = metatype.determine_subtype(layer_attributes, functions_kwargs=functions_kwargs)
+        else:
+            subtype = None
+        if subtype is not None:
+            metatype = subtype
+
+        is_integer_input = False
+        if integer_input_flags is not None and metatype in input_noop_metatypes:
+            is_integer_input = integer_input_flags[op_address.call_order]
 
-        for dynamic_graph_edge in dynamic_graph.get_all_edges():
-            nncf_graph.add_edge_between_nncf_nodes(
-                from_node_id=dynamic_graph_edge.from_node_id,
-                to_node_id=dynamic_graph_edge.to_node_id,
-                tensor_shape=dynamic_graph_edge.activation_shape,
-                input_port_id=dynamic_graph_edge.input_port_id,
-                output_port_id=dynamic_graph_edge.output_port_id,
-                dtype=dynamic_graph_edge.dtype,
-                parallel_input_port_ids=dynamic_graph_edge.parallel_input_port_ids,
+        is_shared = len(module_id_vs_known_op_addrs_map[module_id]) > 1
+        canonical_scope_str = module_id_vs_canonical_scope_str_map[module_id]
+
+        nncf_node = add_nncf_node(
+            node_name=node_name,
+            node_type=op_name,
+            node_metatype=metatype,
+            layer_attributes=layer_attributes,
+            node_id_override=dynamic_graph_node.node_id,
+            layer_name=canonical_scope_str,
+            ignored_algorithms=dynamic_graph_node.ignored_algorithms,
+            is_in_iteration_scope=dynamic_graph_node.is_in_iteration_scope,
+            is_integer_input=is_integer_input,
+            is_shared=is_shared,
+        )
+        if metatype in METATYPES_REQUIRING_ATTRS_FROM_EDGES:
+            nodes_requiring_attrs_from_edges.append(nncf_node)
+
+    nncf_graph.add_edges_between_nncf_nodes(
+        [
+            (
+                dynamic_graph_edge.from_node_id,
+                dynamic_graph_edge.to_node_id,
+                dynamic_graph_edge.activation_shape,
+                dynamic_graph_edge.input_port_id,
+                dynamic_graph_edge.output_port_id,
+                dynamic_graph_edge.dtype,
+                dynamic_graph_edge.parallel_input_port_ids,
             )
+            for dynamic_graph_edge in dynamic_graph.get_all_edges()
+        ]
+    )
+
+    set_nodes_attributes_in_nncf_graph(nncf_graph, nodes_requiring_attrs_from_edges)
+    return nncf_graph
 
-        set_nodes_attributes_in_nncf_graph(nncf_graph)
-        return nncf_graph
+
+class GraphConverter:
+    convert = staticmethod(convert_dynamic_graph_to_nncf_graph)
@@ -10,7 +10,8 @@
 # limitations under the License.
 
 
-from typing import Dict, List, Optional, Type, TypeVar
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple, Type, TypeVar
 
 from nncf.common.graph.definitions import NNCFGraphNodeType
 from nncf.common.graph.layer_attributes import BaseLayerAttributes
@@ -26,7 +27,87 @@ from nncf.torch.dynamic_graph.structs import NamespaceTarget
 
 ModuleAttributes = TypeVar("ModuleAttributes", bound=BaseLayerAttributes)
 
-PT_OPERATOR_METATYPES = OperatorMetatypeRegistry("operator_metatypes")
+
+def _namespace_to_function_names(
+    torch_nn_functional: Tuple[str, ...] = (), torch_tensor: Tuple[str, ...] = (), torch: Tuple[str, ...] = ()
+) -> Mapping[NamespaceTarget, Tuple[str, ...]]:
+    """
+    Builds a read-only `module_to_function_names` mapping for a metatype.
+
+    :param torch_nn_functional: Names of functions from 'torch.nn.functional'.
+    :param torch_tensor: Names of functions from 'torch.tensor'.
+    :param torch: Names of functions from 'torch'.
+    :return: Mapping from the namespaces to the function names, containing only the non-empty namespaces.
+    """
+    namespace_to_function_names = {
+        NamespaceTarget.TORCH_NN_FUNCTIONAL: torch_nn_functional,
+        NamespaceTarget.TORCH_TENSOR: torch_tensor,
+        NamespaceTarget.TORCH: torch,
+    }
+    return MappingProxyType({k: v for k, v in namespace_to_function_names.items() if v})
+
+
+class PTOperatorMetatypeRegistry(OperatorMetatypeRegistry):
+    """
+    Operator metatypes registry that caches collections of the registered PyTorch metatypes.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize registry state.
+
+        :param name: The registry name.
+        """
+        super().__init__(name)
+        self._operator_metatypes: Optional[Tuple[Type[OperatorMetatype], ...]] = None
+        self._metatypes_with_subtypes: Optional[FrozenSet[Type[OperatorMetatype]]] = None
+
+    def register(self, name: Optional[str] = None):
+        """
+        Decorator for registering PyTorch operator metatypes.
+
+        :param name: The registration name.
+        :return: The inner function for registering operator metatypes.
+        """
+        super_wrap = super().register(name)
+
+        def wrap(obj: Type["PTOperatorMetatype"]):
+            """
+            Inner function for registering PyTorch operator metatypes.
+
+            :param obj: The operator metatype.
+            :return: The input operator metatype.
+            """
+            super_wrap(obj)
+            self._operator_metatypes = None
+            self._metatypes_with_subtypes = None
+            return obj
+
+        return wrap
+
+    def get_operator_metatypes(self) -> Tuple[Type[OperatorMetatype], ...]:
+        """
+        Returns all registered operator metatypes. The result is cached until the next registration.
+
+        :return: Tuple of the registered operator metatypes.
+        """
+        if self._operator_metatypes is None:
+            self._operator_metatypes = tuple(self.registry_dict.values())
+        return self._operator_metatypes
+
+    def get_metatypes_with_subtypes(self) -> FrozenSet[Type[OperatorMetatype]]:
+        """
+        Returns the registered operator metatypes for which subtype dispatch via `determine_subtype` has to be
+        performed. The result is cached until the next registration.
+
+        :return: Set of the registered operator metatypes that have subtypes.
+        """
+        if self._metatypes_with_subtypes is None:
+            self._metatypes_with_subtypes = frozenset(m for m in self.registry_dict.values() if m.get_subtypes())
+        return self._metatypes_with_subtypes
+
+
+PT_OPERATOR_METATYPES = PTOperatorMetatypeRegistry("operator_metatypes")
 
 
 class PTOperatorMetatype(OperatorMetatype):
@@ -44,51 +125,55 @@ class PTOperatorMetatype(OperatorMetatype):
     with this metatype.
     :param module_to_function_names: Names of functions from 'torch.nn.function', 'torch.tensor' and 'torch' modules
     respectively, which are associated with this metatype.
-    :param subtypes: List of subtypes of PyTorch operator.
+    :param subtypes: Subtypes of PyTorch operator.
     """
 
-    external_op_names: List[str] = []
+    external_op_names: Tuple[str, ...] = ()
 
-    module_to_function_names: Dict[NamespaceTarget, List[str]] = {
-        NamespaceTarget.TORCH_NN_FUNCTIONAL: [],
-        NamespaceTarget.TORCH_TENSOR: [],
-        NamespaceTarget.TORCH: [],
-    }
+    module_to_function_names: Mapping[NamespaceTarget, Tuple[str, ...]] = _namespace_to_function_names()
 
-    subtypes: List[Type["PTOperatorMetatype"]] = []
+    subtypes: Tuple[Type["PTOperatorMetatype"], ...] = ()
 
     @classmethod
     def get_subtypes(cls) -> List[Type["PTOperatorMetatype"]]:
-        return cls.subtypes.copy()
+        return list(cls.subtypes)
 
     @classmethod
-    def get_all_namespace_to_function_names(cls) -> Dict[NamespaceTarget, List[str]]:
+    def get_all_namespace_to_function_names(cls) -> Dict[NamespaceTarget, Tuple[str, ...]]:
         output = dict(cls.module_to_function_names)
         output[NamespaceTarget.EXTERNAL] = cls.external_op_names
         return output
 
     @classmethod
     def get_all_aliases(cls) -> List[str]:
-        output = set()
-        for _, function_names in cls.module_to_function_names.items():
-            output = output.union(function_names)
-        if cls.external_op_names is not None:
-            output = output.union(cls.external_op_names)
-        return list(output)
+        # The function names are class-level constants, so the aliases are computed once per class. The cache is
+        # looked up in the class' own __dict__ so that it is not inherited by subclasses. The cache is immutable and
+        # a fresh list is returned so that callers mutating the result do not affect the metatype's aliases.
+        aliases = cls.__dict__.get("_all_aliases")
+        if aliases is None:
+            output = set(cls.external_op_names)
+            for function_names in cls.module_to_function_names.values():
+                output.update(function_names)
+            aliases = tuple(output)
+            cls._all_aliases = aliases
+        return list(aliases)
 
     @classmethod
     def determine_subtype(
         cls, layer_attributes: Optional[BaseLayerAttributes] = None, function_args=None, functions_kwargs=None
     ) -> Optional["PTOperatorSubtype"]:
-        matches = []
-        for subtype in cls.get_subtypes():
-            if subtype.matches(layer_attributes, function_args, functions_kwargs):
-                matches.append(subtype)
-        assert len(matches) <= 1, "Multiple subtypes match operator call - cannot determine single subtype."
-        if not matches:
+        subtype = None
+        for candidate in cls.subtypes:
+            if candidate.matches(layer_attributes, function_args, functions_kwargs):
+                # The uniqueness of the match is only verified when assertions are enabled
+                if not __debug__:
+                    subtype = candidate
+                    break
+                assert subtype is None, "Multiple subtypes match operator call - cannot determine single subtype."
+                subtype = candidate
+        if subtype is None:
             return None
 
-        subtype = matches[0]
         nested_subtype = subtype.determine_subtype(layer_attributes, function_args, functions_kwargs)
         if nested_subtype:
             return nested_subtype
@@ -114,10 +199,9 @@ class PTModuleOperatorSubtype(PTOperatorSubtype):
     def matches(
         cls, layer_attributes: Optional[BaseLayerAttributes] = None, function_args=None, functions_kwargs=None
     ) -> bool:
-        key = DynamicGraph.IS_CALLED_INSIDE_NNCF_MODULE
-        if functions_kwargs is None or key not in functions_kwargs:
+        if functions_kwargs is None:
             return False
-        return functions_kwargs[key]
+        return functions_kwargs.get(DynamicGraph.IS_CALLED_INSIDE_NNCF_MODULE, False)
 
 
 class PTDepthwiseConvOperatorSubtype(PTOperatorSubtype):
@@ -127,42 +211,37 @@ class PTDepthwiseConvOperatorSubtype(PTOperatorSubtype):
     ) -> bool:
         if not isinstance(layer_attributes, ConvolutionLayerAttributes):
             return False
-        if layer_attributes.groups == layer_attributes.in_channels and layer_attributes.in_channels > 1:
-            return True
-        return False
+        in_channels = layer_attributes.in_channels
+        return in_channels > 1 and layer_attributes.groups == in_channels
 
 
 @PT_OPERATOR_METATYPES.register()
 @INPUT_NOOP_METATYPES.register()
 class PTInputNoopMetatype(PTOperatorMetatype):
     name = "input_noop"
-    external_op_names = [name, NNCFGraphNodeType.INPUT_NODE]
+    external_op_names = (name, NNCFGraphNodeType.INPUT_NODE)
 
 
 @PT_OPERATOR_METATYPES.register()
 @OUTPUT_NOOP_METATYPES.register()
 class PTOutputNoopMetatype(PTOperatorMetatype):
     name = "output_noop"
-    external_op_names = [name, NNCFGraphNodeType.OUTPUT_NODE]
+    external_op_names = (name, NNCFGraphNodeType.OUTPUT_NODE)
 
 
 @PT_OPERATOR_METATYPES.register()
 @NOOP_METATYPES.register()
 class PTNoopMetatype(PTOperatorMetatype):
     name = "noop"
-    external_op_names = [name]
-    module_to_function_names = {
-        NamespaceTarget.TORCH_NN_FUNCTIONAL: [],
-        NamespaceTarget.TORCH_TENSOR: [],
-        NamespaceTarget.TORCH: ["contiguous", "clone"],
-    }
+    external_op_names = (name,)
+    module_to_function_names = _namespace_to_function_names(torch=("contiguous", "clone"))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTDepthwiseConv1dSubtype(PTDepthwiseConvOperatorSubtype):
     name = "Conv1DOp"
     hw_config_name = [HWConfigOpName.DEPTHWISECONVOLUTION]
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["conv1d"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("conv1d",))
     output_channel_axis = 1
 
 
@@ -170,8 +249,8 @@ class PTDepthwiseConv1dSubtype(PTDepthwiseConvOperatorSubtype):
 class PTModuleConv1dMetatype(PTModuleOperatorSubtype):
     name = "Conv1DOp"
     hw_config_names = [HWConfigOpName.CONVOLUTION]
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["conv1d"]}
-    subtypes = [PTDepthwiseConv1dSubtype]
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("conv1d",))
+    subtypes = (PTDepthwiseConv1dSubtype,)
     output_channel_axis = 1
 
 
@@ -179,8 +258,8 @@ class PTModuleConv1dMetatype(PTModuleOperatorSubtype):
 class PTConv1dMetatype(PTOperatorMetatype):
     name = "Conv1DOp"
     hw_config_names = [HWConfigOpName.CONVOLUTION]
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["conv1d"]}
-    subtypes = [PTModuleConv1dMetatype]
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("conv1d",))
+    subtypes = (PTModuleConv1dMetatype,)
     output_channel_axis = 1
 
 
@@ -188,7 +267,7 @@ class PTConv1dMetatype(PTOperatorMetatype):
 class PTDepthwiseConv2dSubtype(PTDepthwiseConvOperatorSubtype):
     name = "Conv2DOp"
     hw_config_names = [HWConfigOpName.DEPTHWISECONVOLUTION]
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["conv2d"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("conv2d",))
     output_channel_axis = 1
 
 
@@ -196,8 +275,8 @@ class PTDepthwiseConv2dSubtype(PTDepthwiseConvOperatorSubtype):
 class PTModuleConv2dMetatype(PTModuleOperatorSubtype):
     name = "Conv2DOp"
     hw_config_names = [HWConfigOpName.CONVOLUTION]
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["conv2d"]}
-    subtypes = [PTDepthwiseConv2dSubtype]
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("conv2d",))
+    subtypes = (PTDepthwiseConv2dSubtype,)
     output_channel_axis = 1
 
 
@@ -205,8 +284,8 @@ class PTModuleConv2dMetatype(PTModuleOperatorSubtype):
 class PTConv2dMetatype(PTOperatorMetatype):
     name = "Conv2DOp"
     hw_config_names = [HWConfigOpName.CONVOLUTION]
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["conv2d"]}
-    subtypes = [PTModuleConv2dMetatype]
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("conv2d",))
+    subtypes = (PTModuleConv2dMetatype,)
     output_channel_axis = 1
 
 
@@ -214,7 +293,7 @@ class PTConv2dMetatype(PTOperatorMetatype):
 class PTDepthwiseConv3dSubtype(PTDepthwiseConvOperatorSubtype):
     name = "Conv3DOp"
     hw_config_names = [HWConfigOpName.DEPTHWISECONVOLUTION]
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["conv3d"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("conv3d",))
     output_channel_axis = 1
 
 
@@ -222,8 +301,8 @@ class PTDepthwiseConv3dSubtype(PTDepthwiseConvOperatorSubtype):
 class PTModuleConv3dMetatype(PTModuleOperatorSubtype):
     name = "Conv3DOp"
     hw_config_names = [HWConfigOpName.CONVOLUTION]
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["conv3d"]}
-    subtypes = [PTDepthwiseConv3dSubtype]
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("conv3d",))
+    subtypes = (PTDepthwiseConv3dSubtype,)
     output_channel_axis = 1
 
 
@@ -231,8 +310,8 @@ class PTModuleConv3dMetatype(PTModuleOperatorSubtype):
 class PTConv3dMetatype(PTOperatorMetatype):
     name = "Conv3DOp"
     hw_config_names = [HWConfigOpName.CONVOLUTION]
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["conv3d"]}
-    subtypes = [PTModuleConv3dMetatype]
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("conv3d",))
+    subtypes = (PTModuleConv3dMetatype,)
     output_channel_axis = 1
 
 
@@ -240,7 +319,7 @@ class PTConv3dMetatype(PTOperatorMetatype):
 class PTModuleConvTranspose1dMetatype(PTModuleOperatorSubtype):
     name = "ConvTranspose1DOp"
     hw_config_names = [HWConfigOpName.CONVOLUTION]
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["conv_transpose1d"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("conv_transpose1d",))
     output_channel_axis = 1
 
 
@@ -248,8 +327,8 @@ class PTModuleConvTranspose1dMetatype(PTModuleOperatorSubtype):
 class PTConvTranspose1dMetatype(PTOperatorMetatype):
     name = "ConvTranspose1DOp"
     hw_config_names = [HWConfigOpName.CONVOLUTION]
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["conv_transpose1d"]}
-    subtypes = [PTModuleConvTranspose1dMetatype]
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("conv_transpose1d",))
+    subtypes = (PTModuleConvTranspose1dMetatype,)
     output_channel_axis = 1
 
 
@@ -257,7 +336,7 @@ class PTConvTranspose1dMetatype(PTOperatorMetatype):
 class PTModuleConvTranspose2dMetatype(PTModuleOperatorSubtype):
     name = "ConvTranspose2DOp"
     hw_config_names = [HWConfigOpName.CONVOLUTION]
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["conv_transpose2d"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("conv_transpose2d",))
     output_channel_axis = 1
 
 
@@ -265,8 +344,8 @@ class PTModuleConvTranspose2dMetatype(PTModuleOperatorSubtype):
 class PTConvTranspose2dMetatype(PTOperatorMetatype):
     name = "ConvTranspose2DOp"
     hw_config_names = [HWConfigOpName.CONVOLUTION]
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["conv_transpose2d"]}
-    subtypes = [PTModuleConvTranspose2dMetatype]
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("conv_transpose2d",))
+    subtypes = (PTModuleConvTranspose2dMetatype,)
     output_channel_axis = 1
 
 
@@ -274,7 +353,7 @@ class PTConvTranspose2dMetatype(PTOperatorMetatype):
 class PTModuleConvTranspose3dMetatype(PTModuleOperatorSubtype):
     name = "ConvTranspose3DOp"
     hw_config_names = [HWConfigOpName.CONVOLUTION]
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["conv_transpose3d"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("conv_transpose3d",))
     output_channel_axis = 1
 
 
@@ -282,28 +361,28 @@ class PTModuleConvTranspose3dMetatype(PTModuleOperatorSubtype):
 class PTConvTranspose3dMetatype(PTOperatorMetatype):
     name = "ConvTranspose3DOp"
     hw_config_names = [HWConfigOpName.CONVOLUTION]
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["conv_transpose3d"]}
-    subtypes = [PTModuleConvTranspose3dMetatype]
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("conv_transpose3d",))
+    subtypes = (PTModuleConvTranspose3dMetatype,)
     output_channel_axis = 1
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTModuleDeformConv2dMetatype(PTModuleOperatorSubtype):
     name = "DeformConv2dOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["deform_conv2d"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("deform_conv2d",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTDeformConv2dMetatype(PTOperatorMetatype):
     name = "DeformConv2dOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["deform_conv2d"]}
-    subtypes = [PTModuleDeformConv2dMetatype]
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("deform_conv2d",))
+    subtypes = (PTModuleDeformConv2dMetatype,)
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTModuleLinearMetatype(PTModuleOperatorSubtype):
     name = "LinearOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["linear"], NamespaceTarget.TORCH: ["addmm"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("linear",), torch=("addmm",))
     hw_config_names = [HWConfigOpName.MATMUL]
     output_channel_axis = -1
 
@@ -311,201 +390,186 @@ class PTModuleLinearMetatype(PTModuleOperatorSubtype):
 @PT_OPERATOR_METATYPES.register()
 class PTLinearMetatype(PTOperatorMetatype):
     name = "LinearOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["linear"], NamespaceTarget.TORCH: ["addmm"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("linear",), torch=("addmm",))
     hw_config_names = [HWConfigOpName.MATMUL]
-    subtypes = [PTModuleLinearMetatype]
+    subtypes = (PTModuleLinearMetatype,)
     output_channel_axis = -1
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTHardTanhMetatype(PTOperatorMetatype):
     name = "HardTanhOP"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["hardtanh"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("hardtanh",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTHardSwishMetatype(PTOperatorMetatype):
     name = "HardSwishOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["hardswish"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("hardswish",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTHardSigmoidMetatype(PTOperatorMetatype):
     name = "HardSigmoidOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["hardsigmoid"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("hardsigmoid",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTTanhMetatype(PTOperatorMetatype):
     name = "TanhOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["tanh"], NamespaceTarget.TORCH: ["tanh"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("tanh",), torch=("tanh",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTELUMetatype(PTOperatorMetatype):
     name = "EluOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["elu", "elu_"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("elu", "elu_"))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTPRELUMetatype(PTOperatorMetatype):
     name = "PReluOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["prelu"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("prelu",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTLeakyRELUMetatype(PTOperatorMetatype):
     name = "LeakyReluOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["leaky_relu"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("leaky_relu",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTModuleLayerNormMetatype(PTModuleOperatorSubtype):
     name = "LayerNormOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["layer_norm"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("layer_norm",))
     hw_config_names = [HWConfigOpName.MVN]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTLayerNormMetatype(PTOperatorMetatype):
     name = "LayerNormOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["layer_norm"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("layer_norm",))
     hw_config_names = [HWConfigOpName.MVN]
-    subtypes = [PTModuleLayerNormMetatype]
+    subtypes = (PTModuleLayerNormMetatype,)
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTModuleGroupNormMetatype(PTModuleOperatorSubtype):
     name = "GroupNormOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["group_norm"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("group_norm",))
     hw_config_names = [HWConfigOpName.MVN]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTGroupNormMetatype(PTOperatorMetatype):
     name = "GroupNormOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["group_norm"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("group_norm",))
     hw_config_names = [HWConfigOpName.MVN]
-    subtypes = [PTModuleGroupNormMetatype]
+    subtypes = (PTModuleGroupNormMetatype,)
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTGELUMetatype(PTOperatorMetatype):
     name = "GeluOp"
     hw_config_names = [HWConfigOpName.GELU]
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["gelu"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("gelu",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTSILUMetatype(PTOperatorMetatype):
     name = "SiluOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["silu"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("silu",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTSigmoidMetatype(PTOperatorMetatype):
     name = "SigmoidOp"
-    module_to_function_names = {
-        NamespaceTarget.TORCH_NN_FUNCTIONAL: ["sigmoid"],
-        NamespaceTarget.TORCH_TENSOR: ["sigmoid"],
-        NamespaceTarget.TORCH: ["sigmoid"],
-    }
+    module_to_function_names = _namespace_to_function_names(
+        torch_nn_functional=("sigmoid",), torch_tensor=("sigmoid",), torch=("sigmoid",)
+    )
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTAddMetatype(PTOperatorMetatype):
     name = "AddOp"
-    module_to_function_names = {
-        NamespaceTarget.TORCH_TENSOR: ["add", "__add__", "__iadd__", "__radd__"],
-        NamespaceTarget.TORCH: ["add"],
-    }
+    module_to_function_names = _namespace_to_function_names(
+        torch_tensor=("add", "__add__", "__iadd__", "__radd__"), torch=("add",)
+    )
     hw_config_names = [HWConfigOpName.ADD]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTSubMetatype(PTOperatorMetatype):
     name = "SubOp"
-    module_to_function_names = {
-        NamespaceTarget.TORCH_TENSOR: ["sub", "__sub__", "__isub__", "__rsub__"],
-        NamespaceTarget.TORCH: ["sub"],
-    }
+    module_to_function_names = _namespace_to_function_names(
+        torch_tensor=("sub", "__sub__", "__isub__", "__rsub__"), torch=("sub",)
+    )
     hw_config_names = [HWConfigOpName.SUBTRACT]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTMulMetatype(PTOperatorMetatype):
     name = "MulOp"
-    module_to_function_names = {
-        NamespaceTarget.TORCH_TENSOR: ["mul", "__mul__", "__imul__", "__rmul__"],
-        NamespaceTarget.TORCH: ["mul"],
-    }
+    module_to_function_names = _namespace_to_function_names(
+        torch_tensor=("mul", "__mul__", "__imul__", "__rmul__"), torch=("mul",)
+    )
     hw_config_names = [HWConfigOpName.MULTIPLY]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTDivMetatype(PTOperatorMetatype):
     name = "DivOp"
-    module_to_function_names = {
-        NamespaceTarget.TORCH_TENSOR: ["__div__", "__idiv__", "__truediv__"],
-        NamespaceTarget.TORCH: ["div"],
-    }
+    module_to_function_names = _namespace_to_function_names(
+        torch_tensor=("__div__", "__idiv__", "__truediv__"), torch=("div",)
+    )
     hw_config_names = [HWConfigOpName.DIVIDE]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTFloorDivMetatype(PTOperatorMetatype):
     name = "FloordivOp"
-    module_to_function_names = {
-        NamespaceTarget.TORCH_TENSOR: ["__floordiv__", "__ifloordiv__", "__rfloordiv__"],
-    }
+    module_to_function_names = _namespace_to_function_names(
+        torch_tensor=("__floordiv__", "__ifloordiv__", "__rfloordiv__")
+    )
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTExpMetatype(PTOperatorMetatype):
     name = "ExpOp"
-    module_to_function_names = {
-        NamespaceTarget.TORCH: ["exp"],
-    }
+    module_to_function_names = _namespace_to_function_names(torch=("exp",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTLogMetatype(PTOperatorMetatype):
     name = "LogOp"
-    module_to_function_names = {
-        NamespaceTarget.TORCH: ["log"],
-    }
+    module_to_function_names = _namespace_to_function_names(torch=("log",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTAbsMetatype(PTOperatorMetatype):
     name = "AbsOp"
-    module_to_function_names = {
-        NamespaceTarget.TORCH: ["abs"],
-    }
+    module_to_function_names = _namespace_to_function_names(torch=("abs",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTErfMetatype(PTOperatorMetatype):
     name = "ErfOp"
-    module_to_function_names = {
-        NamespaceTarget.TORCH: ["erf"],
-    }
+    module_to_function_names = _namespace_to_function_names(torch=("erf",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTMatMulMetatype(PTOperatorMetatype):
     name = "MatMulOp"
-    module_to_function_names = {
-        NamespaceTarget.TORCH_TENSOR: ["matmul", "__matmul__"],
-        NamespaceTarget.TORCH: ["matmul", "bmm", "mm"],
-    }
+    module_to_function_names = _namespace_to_function_names(
+        torch_tensor=("matmul", "__matmul__"), torch=("matmul", "bmm", "mm")
+    )
     hw_config_names = [HWConfigOpName.MATMUL]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTBaddBmmMetatype(PTOperatorMetatype):
     name = "MatMulOp"
-    module_to_function_names = {NamespaceTarget.TORCH: ["baddbmm"]}
+    module_to_function_names = _namespace_to_function_names(torch=("baddbmm",))
     hw_config_names = [HWConfigOpName.MATMUL]
     # 0-th arg to the baddbmm is basically a (b)ias to be (add)ed to the (bmm) operation,
     # presuming that most runtime implementations will fuse the bias addition into the matrix multiplication
@@ -516,373 +580,363 @@ class PTBaddBmmMetatype(PTOperatorMetatype):
 @PT_OPERATOR_METATYPES.register()
 class PTMeanMetatype(PTOperatorMetatype):
     name = "MeanOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["mean"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("mean",))
     hw_config_names = [HWConfigOpName.REDUCEMEAN]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTRoundMetatype(PTOperatorMetatype):
     name = "RoundOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["round"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("round",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTDropoutMetatype(PTOperatorMetatype):
     name = "DropoutOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["dropout"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("dropout",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTThresholdMetatype(PTOperatorMetatype):
     name = "ThresholdOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["threshold"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("threshold",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTModuleBatchNormMetatype(PTModuleOperatorSubtype):
     name = "BatchNormOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["batch_norm"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("batch_norm",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTBatchNormMetatype(PTOperatorMetatype):
     name = "BatchNormOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["batch_norm"]}
-    subtypes = [PTModuleBatchNormMetatype]
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("batch_norm",))
+    subtypes = (PTModuleBatchNormMetatype,)
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTAvgPool2dMetatype(PTOperatorMetatype):
     name = "AvgPool2DOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["avg_pool2d", "adaptive_avg_pool2d"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("avg_pool2d", "adaptive_avg_pool2d"))
     hw_config_names = [HWConfigOpName.AVGPOOL]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTAvgPool3dMetatype(PTOperatorMetatype):
     name = "AvgPool3DOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["avg_pool3d", "adaptive_avg_pool3d"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("avg_pool3d", "adaptive_avg_pool3d"))
     hw_config_names = [HWConfigOpName.AVGPOOL]
 
 
 class PTMaxPool1dMetatype(PTOperatorMetatype):
     name = "MaxPool1DOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["max_pool1d", "adaptive_max_pool1d"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("max_pool1d", "adaptive_max_pool1d"))
     hw_config_names = [HWConfigOpName.MAXPOOL]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTMaxPool2dMetatype(PTOperatorMetatype):
     name = "MaxPool2DOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["max_pool2d", "adaptive_max_pool2d"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("max_pool2d", "adaptive_max_pool2d"))
     hw_config_names = [HWConfigOpName.MAXPOOL]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTMaxPool3dMetatype(PTOperatorMetatype):
     name = "MaxPool3DOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["max_pool3d", "adaptive_max_pool3d"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("max_pool3d", "adaptive_max_pool3d"))
     hw_config_names = [HWConfigOpName.MAXPOOL]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTMaxUnpool1dMetatype(PTOperatorMetatype):
     name = "MaxUnPool1DOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["max_unpool1d"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("max_unpool1d",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTMaxUnpool2dMetatype(PTOperatorMetatype):
     name = "MaxUnPool2DOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["max_unpool2d"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("max_unpool2d",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTMaxUnpool3dMetatype(PTOperatorMetatype):
     name = "MaxUnPool3DOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["max_unpool3d"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("max_unpool3d",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTPadMetatype(PTOperatorMetatype):
     name = "PadOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["pad"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("pad",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTCatMetatype(PTOperatorMetatype):
     name = "CatOp"
-    module_to_function_names = {NamespaceTarget.TORCH: ["cat", "stack"]}
+    module_to_function_names = _namespace_to_function_names(torch=("cat", "stack"))
     hw_config_names = [HWConfigOpName.CONCAT]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTRELUMetatype(PTOperatorMetatype):
     name = "ReluOp"
-    module_to_function_names = {NamespaceTarget.TORCH: ["relu", "relu_"]}
+    module_to_function_names = _namespace_to_function_names(torch=("relu", "relu_"))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTRELU6Metatype(PTOperatorMetatype):
     name = "Relu6Op"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["relu6"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("relu6",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTMaxMetatype(PTOperatorMetatype):
     name = "MaxOp"
-    module_to_function_names = {NamespaceTarget.TORCH: ["max"]}
+    module_to_function_names = _namespace_to_function_names(torch=("max",))
     hw_config_names = [HWConfigOpName.MAXIMUM, HWConfigOpName.REDUCEMAX]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTMinMetatype(PTOperatorMetatype):
     name = "MinOp"
-    module_to_function_names = {NamespaceTarget.TORCH: ["min"]}
+    module_to_function_names = _namespace_to_function_names(torch=("min",))
     hw_config_names = [HWConfigOpName.MINIMUM]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTTransposeMetatype(PTOperatorMetatype):
     name = "TransposeOp"
-    module_to_function_names = {
-        NamespaceTarget.TORCH_TENSOR: ["transpose", "permute", "transpose_"],
-        NamespaceTarget.TORCH: ["transpose"],
-    }
+    module_to_function_names = _namespace_to_function_names(
+        torch_tensor=("transpose", "permute", "transpose_"), torch=("transpose",)
+    )
     hw_config_names = [HWConfigOpName.TRANSPOSE]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTGatherMetatype(PTOperatorMetatype):
     name = "GatherOp"
-    module_to_function_names = {
-        NamespaceTarget.TORCH_TENSOR: ["index_select", "__getitem__"],
-        NamespaceTarget.TORCH: ["gather", "index_select", "where"],
-    }
+    module_to_function_names = _namespace_to_function_names(
+        torch_tensor=("index_select", "__getitem__"), torch=("gather", "index_select", "where")
+    )
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTScatterMetatype(PTOperatorMetatype):
     name = "ScatterOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["scatter", "masked_fill", "masked_fill_"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("scatter", "masked_fill", "masked_fill_"))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTReshapeMetatype(PTOperatorMetatype):
     name = "ReshapeOp"
-    module_to_function_names = {
-        NamespaceTarget.TORCH_TENSOR: ["reshape", "view", "flatten", "unsqueeze"],
-        NamespaceTarget.TORCH: ["flatten", "unsqueeze"],
-    }
+    module_to_function_names = _namespace_to_function_names(
+        torch_tensor=("reshape", "view", "flatten", "unsqueeze"), torch=("flatten", "unsqueeze")
+    )
     hw_config_names = [HWConfigOpName.RESHAPE, HWConfigOpName.UNSQUEEZE, HWConfigOpName.FLATTEN]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTSqueezeMetatype(PTOperatorMetatype):
     name = "SqueezeOp"
-    module_to_function_names = {
-        NamespaceTarget.TORCH_TENSOR: ["squeeze"],
-        NamespaceTarget.TORCH: ["squeeze"],
-    }
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("squeeze",), torch=("squeeze",))
     hw_config_names = [HWConfigOpName.SQUEEZE]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTSplitMetatype(PTOperatorMetatype):
     name = "SplitOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["split", "chunk", "unbind"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("split", "chunk", "unbind"))
     hw_config_names = [HWConfigOpName.SPLIT, HWConfigOpName.CHUNK]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTExpandMetatype(PTOperatorMetatype):
     name = "ExpandOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["expand"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("expand",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTExpandAsMetatype(PTOperatorMetatype):
     name = "ExpandAsOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["expand_as"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("expand_as",))
 
 
 # Non-quantizable ops
 @PT_OPERATOR_METATYPES.register()
 class PTModuleEmbeddingMetatype(PTModuleOperatorSubtype):
     name = "EmbeddingOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["embedding"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("embedding",))
     hw_config_names = [HWConfigOpName.EMBEDDING]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTEmbeddingMetatype(PTOperatorMetatype):
     name = "EmbeddingOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["embedding"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("embedding",))
     hw_config_names = [HWConfigOpName.EMBEDDING]
-    subtypes = [PTModuleEmbeddingMetatype]
+    subtypes = (PTModuleEmbeddingMetatype,)
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTModuleEmbeddingBagMetatype(PTModuleOperatorSubtype):
     name = "EmbeddingBagOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["embedding_bag"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("embedding_bag",))
     hw_config_names = [HWConfigOpName.EMBEDDINGBAG]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTEmbeddingBagMetatype(PTOperatorMetatype):
     name = "EmbeddingBagOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["embedding_bag"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("embedding_bag",))
     hw_config_names = [HWConfigOpName.EMBEDDINGBAG]
-    subtypes = [PTModuleEmbeddingBagMetatype]
+    subtypes = (PTModuleEmbeddingBagMetatype,)
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTSoftmaxMetatype(PTOperatorMetatype):
     name = "SoftmaxOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["softmax"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("softmax",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTLessMetatype(PTOperatorMetatype):
     name = "LessOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["__lt__"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("__lt__",))
     hw_config_names = [HWConfigOpName.LESS]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTLessEqualMetatype(PTOperatorMetatype):
     name = "LessEqualOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["__le__"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("__le__",))
     hw_config_names = [HWConfigOpName.LESSEQUAL]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTGreaterMetatype(PTOperatorMetatype):
     name = "GreaterOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["__gt__"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("__gt__",))
     hw_config_names = [HWConfigOpName.GREATER]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTGreaterEqualMetatype(PTOperatorMetatype):
     name = "GreaterEqualOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["__ge__"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("__ge__",))
     hw_config_names = [HWConfigOpName.GREATEREQUAL]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTModMetatype(PTOperatorMetatype):
     name = "ModOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["__mod__"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("__mod__",))
     hw_config_names = [HWConfigOpName.FLOORMOD]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTEqualsMetatype(PTOperatorMetatype):
     name = "EqualsOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["__eq__"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("__eq__",))
     hw_config_names = [HWConfigOpName.EQUAL]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTNotEqualMetatype(PTOperatorMetatype):
     name = "NotEqualOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["__ne__"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("__ne__",))
     hw_config_names = [HWConfigOpName.NOTEQUAL]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTLogicalOrMetatype(PTOperatorMetatype):
     name = "LogicalOrOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["__or__"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("__or__",))
     hw_config_names = [HWConfigOpName.LOGICALOR]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTLogicalXorMetatype(PTOperatorMetatype):
     name = "LogicalXorOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["__xor__"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("__xor__",))
     hw_config_names = [HWConfigOpName.LOGICALXOR]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTLogicalAndMetatype(PTOperatorMetatype):
     name = "LogicalAndOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["__and__"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("__and__",))
     hw_config_names = [HWConfigOpName.LOGICALAND]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTLogicalNotMetatype(PTOperatorMetatype):
     name = "LogicalNotOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["logical_not_"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("logical_not_",))
     hw_config_names = [HWConfigOpName.LOGICALNOT]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTPowerMetatype(PTOperatorMetatype):
     name = "PowerOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["__pow__", "pow"], NamespaceTarget.TORCH: ["pow"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("__pow__", "pow"), torch=("pow",))
     hw_config_names = [HWConfigOpName.POWER]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTSqrtMetatype(PTOperatorMetatype):
     name = "SqrtOp"
-    module_to_function_names = {
-        NamespaceTarget.TORCH_TENSOR: ["sqrt", "sqrt_"],
-        NamespaceTarget.TORCH: ["sqrt", "sqrt_"],
-    }
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("sqrt", "sqrt_"), torch=("sqrt", "sqrt_"))
     hw_config_names = [HWConfigOpName.POWER]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTInterpolateMetatype(PTOperatorMetatype):
     name = "InterpolateOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["interpolate"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("interpolate",))
     hw_config_names = [HWConfigOpName.INTERPOLATE]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTRepeatMetatype(PTOperatorMetatype):
     name = "RepeatOp"
-    module_to_function_names = {NamespaceTarget.TORCH: ["repeat_interleave"]}
+    module_to_function_names = _namespace_to_function_names(torch=("repeat_interleave",))
     hw_config_names = [HWConfigOpName.TILE]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTPixelShuffleMetatype(PTOperatorMetatype):
     name = "PixelShuffleOp"
-    module_to_function_names = {NamespaceTarget.TORCH_NN_FUNCTIONAL: ["pixel_shuffle"]}
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("pixel_shuffle",))
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTSumMetatype(PTOperatorMetatype):
     name = "SumOp"
-    module_to_function_names = {NamespaceTarget.TORCH_TENSOR: ["sum"], NamespaceTarget.TORCH: ["sum"]}
+    module_to_function_names = _namespace_to_function_names(torch_tensor=("sum",), torch=("sum",))
     hw_config_names = [HWConfigOpName.REDUCESUM]
 
 
 @PT_OPERATOR_METATYPES.register()
 class PTReduceL2(PTOperatorMetatype):
     name = "ReduceL2"
-    module_to_function_names = {
-        NamespaceTarget.TORCH_NN_FUNCTIONAL: ["normalize"],  # note: normalize is for general L_p normalization
-    }
+    # note: normalize is for general L_p normalization
+    module_to_function_names = _namespace_to_function_names(torch_nn_functional=("normalize",))
     hw_config_names = [HWConfigOpName.REDUCEL2]
 
 
-def get_operator_metatypes() -> List[Type[OperatorMetatype]]:
+def get_operator_metatypes() -> Tuple[Type[OperatorMetatype], ...]:
     """
-    Returns a list of the operator metatypes.
+    Returns a tuple of the operator metatypes.
 
-    :return: List of operator metatypes .
+    :return: Tuple of operator metatypes.
     """
-    return list(PT_OPERATOR_METATYPES.registry_dict.values())
+    return PT_OPERATOR_METATYPES.get_operator_metatypes()
 
 
-OPERATORS_WITH_WEIGHTS_METATYPES = [
+OPERATORS_WITH_WEIGHTS_METATYPES = (
     PTModuleConv1dMetatype,
     PTModuleConv2dMetatype,
     PTModuleConv3dMetatype,
@@ -898,9 +952,9 @@ OPERATORS_WITH_WEIGHTS_METATYPES = [
     PTModuleConvTranspose3dMetatype,
     PTModuleEmbeddingMetatype,
     PTModuleEmbeddingBagMetatype,
-]
+)
 
-UNIFICATION_PRODUCING_METATYPES = [
+UNIFICATION_PRODUCING_METATYPES = (
     PTModuleConv1dMetatype,
     PTModuleConv2dMetatype,
     PTModuleConv3dMetatype,
@@ -911,12 +965,12 @@ UNIFICATION_PRODUCING_METATYPES = [
     PTModuleConvTranspose2dMetatype,
     PTModuleConvTranspose3dMetatype,
     PTModuleLinearMetatype,
-]
+)
 
-OP_NAMES_WITH_WEIGHTS = [x for meta in OPERATORS_WITH_WEIGHTS_METATYPES for x in meta.get_all_aliases()]
+OP_NAMES_WITH_WEIGHTS = frozenset(x for meta in OPERATORS_WITH_WEIGHTS_METATYPES for x in meta.get_all_aliases())
 
 # Contains the operation metatypes for which bias can be applied.
-OPERATORS_WITH_BIAS_METATYPES = [
+OPERATORS_WITH_BIAS_METATYPES = (
     PTModuleConv1dMetatype,
     PTModuleConv2dMetatype,
     PTModuleConv3dMetatype,
@@ -926,10 +980,16 @@ OPERATORS_WITH_BIAS_METATYPES = [
     PTModuleConvTranspose1dMetatype,
     PTModuleConvTranspose2dMetatype,
     PTModuleConvTranspose3dMetatype,
-]
+)
 
-OPERATORS_FUSED_METATYPES = [
+OPERATORS_FUSED_METATYPES = (
     PTModuleBatchNormMetatype,
-]
+)
+
+# Set counterparts of the metatype tuples above for membership checks in graph passes
+OPERATORS_WITH_WEIGHTS_METATYPES_SET = frozenset(OPERATORS_WITH_WEIGHTS_METATYPES)
+UNIFICATION_PRODUCING_METATYPES_SET = frozenset(UNIFICATION_PRODUCING_METATYPES)
+OPERATORS_WITH_BIAS_METATYPES_SET = frozenset(OPERATORS_WITH_BIAS_METATYPES)
+OPERATORS_FUSED_METATYPES_SET = frozenset(OPERATORS_FUSED_METATYPES)
 
-OP_NAMES_QUANTIZE_NODE = ["symmetric_quantize", "asymmetric_quantize"]
+OP_NAMES_QUANTIZE_NODE = frozenset(["symmetric_quantize", "asymmetric_quantize"])
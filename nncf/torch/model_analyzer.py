@@ -16,8 +16,8 @@ import torch
 from nncf.common.graph.graph import NNCFGraph
 from nncf.common.graph.graph import NNCFNode
 from nncf.torch.graph.operator_metatypes import OP_NAMES_QUANTIZE_NODE
-from nncf.torch.graph.operator_metatypes import OPERATORS_FUSED_METATYPES
-from nncf.torch.graph.operator_metatypes import OPERATORS_WITH_BIAS_METATYPES
+from nncf.torch.graph.operator_metatypes import OPERATORS_FUSED_METATYPES_SET
+from nncf.torch.graph.operator_metatypes import OPERATORS_WITH_BIAS_METATYPES_SET
 from nncf.torch.nncf_network import NNCFNetwork
 
 
@@ -31,10 +31,10 @@ def get_potential_fused_node(node_name: str, nncf_graph: NNCFGraph) -> Optional[
     """
     target_node = nncf_graph.get_node_by_name(node_name)
 
-    if target_node.metatype in OPERATORS_WITH_BIAS_METATYPES:
+    if target_node.metatype in OPERATORS_WITH_BIAS_METATYPES_SET:
         next_nodes = nncf_graph.get_next_nodes(target_node)
         for node in next_nodes:
-            if node.metatype in OPERATORS_FUSED_METATYPES:
+            if node.metatype in OPERATORS_FUSED_METATYPES_SET:
                 return node
     return None
 
@@ -51,7 +51,7 @@ def is_node_with_fused_bias(node: NNCFNode, nncf_graph: NNCFGraph) -> bool:
     """
     fused_node = get_potential_fused_node(node.node_name, nncf_graph)
 
-    return node.metatype in OPERATORS_WITH_BIAS_METATYPES and (
+    return node.metatype in OPERATORS_WITH_BIAS_METATYPES_SET and (
         node.layer_attributes.with_bias if fused_node is None else fused_node.layer_attributes.with_bias
     )
 
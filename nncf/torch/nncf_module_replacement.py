@@ -175,7 +175,7 @@ def replace_modules_by_nncf_modules(
     for module, scope_set in modules_vs_scopes_dict.items():
         if is_nncf_module(module):
             # The module has already been extended, track it in the return value
-            ret_dict[module] = list(sorted(scope_set, key=str))
+            ret_dict[module] = sorted(scope_set, key=str)
             continue
         should_process = _is_scopes_allow_replacement(
             scope_set, ignored_scopes, target_scopes, eval_op_scopes
@@ -194,7 +194,7 @@ def replace_modules_by_nncf_modules(
                 new_scope = scope.copy()
                 new_scope[-1].calling_module_class_name = replaced_module.__class__.__name__
                 new_scope_set.add(new_scope)
-                ret_dict[replaced_module] = list(sorted(new_scope_set, key=str))
+            ret_dict[replaced_module] = sorted(new_scope_set, key=str)
 
     for replaced_module, old_scope_set in inter_dict.items():
         for old_scope in old_scope_set:
@@ -54,7 +54,7 @@ from nncf.torch.dynamic_graph.wrappers import wrap_module_call
 from nncf.torch.graph.graph import PTNNCFGraph
 from nncf.torch.graph.graph_builder import GraphBuilder
 from nncf.torch.graph.graph_builder import GraphConverter
-from nncf.torch.graph.operator_metatypes import OPERATORS_WITH_WEIGHTS_METATYPES
+from nncf.torch.graph.operator_metatypes import OPERATORS_WITH_WEIGHTS_METATYPES_SET
 from nncf.torch.graph.operator_metatypes import PTSplitMetatype
 from nncf.torch.graph.transformations.commands import PTTargetPoint
 from nncf.torch.knowledge_distillation.knowledge_distillation_handler import KnowledgeDistillationLossHandler
@@ -485,10 +485,10 @@ class NNCFNetworkInterface(torch.nn.Module):
                         continue
                 nodes_in_scope = self._original_graph.get_op_nodes_in_scope(nncf_module_scope)
                 for node in nodes_in_scope:
-                    if node.metatype in OPERATORS_WITH_WEIGHTS_METATYPES:
+                    if node.metatype in OPERATORS_WITH_WEIGHTS_METATYPES_SET:
                         retval.add(node)
 
-        return list(sorted(retval, key=str))
+        return sorted(retval, key=str)
 
     def rebuild_graph(self, *input_args):
         self._compressed_context.reset_graph()
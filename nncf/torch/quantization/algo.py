@@ -78,7 +78,7 @@ from nncf.torch.algo_selector import ZeroCompressionLoss
 from nncf.torch.compression_method_api import PTCompressionAlgorithmBuilder
 from nncf.torch.compression_method_api import PTCompressionAlgorithmController
 from nncf.torch.graph.graph import PTNNCFGraph
-from nncf.torch.graph.operator_metatypes import UNIFICATION_PRODUCING_METATYPES
+from nncf.torch.graph.operator_metatypes import UNIFICATION_PRODUCING_METATYPES_SET
 from nncf.torch.graph.operator_metatypes import PTCatMetatype
 from nncf.torch.graph.operator_metatypes import PTDepthwiseConv2dSubtype
 from nncf.torch.graph.operator_metatypes import PTModuleConv2dMetatype
@@ -349,7 +349,7 @@ class PropagationBasedQuantizerSetupGenerator(QuantizerSetupGeneratorBase):
             self._debug_interface.visualize_insertion_point_graph(insertion_point_graph)
         from nncf.common.quantization.quantizer_propagation.solver import QuantizerPropagationSolver
 
-        scales_unification_map = {PTCatMetatype: UNIFICATION_PRODUCING_METATYPES}
+        scales_unification_map = {PTCatMetatype: UNIFICATION_PRODUCING_METATYPES_SET}
         ignored_scopes_for_solver = {
             name: IgnoreReason.USER_REQUESTED for name in self._ignored_scopes_per_group[QuantizerGroup.ACTIVATIONS]
         }
@@ -107,3 +107,24 @@ def test_parallel_edges():
         output_port_id=15,
     )
     assert ordinary_edge == output_edges[-1]
+
+
+def test_add_edges_between_nncf_nodes():
+    edges_graph = NNCFGraph()
+    ref_graph = NNCFGraph()
+    for graph in [edges_graph, ref_graph]:
+        for node in "abc":
+            graph.add_nncf_node(node, f"type_{node}", f"metatype_{node}")
+    edges = [
+        (0, 1, (1, 2, 3), 0, 0, Dtype.FLOAT, [1, 2]),
+        (0, 2, (1, 2, 3), 0, 1, Dtype.FLOAT, None),
+        (1, 2, (1, 2), 1, 0, Dtype.INTEGER, []),
+    ]
+
+    edges_graph.add_edges_between_nncf_nodes(edges)
+    for edge in edges:
+        ref_graph.add_edge_between_nncf_nodes(*edge)
+
+    for node, ref_node in zip(edges_graph.get_all_nodes(), ref_graph.get_all_nodes()):
+        assert edges_graph.get_input_edges(node) == ref_graph.get_input_edges(ref_node)
+        assert edges_graph.get_output_edges(node) == ref_graph.get_output_edges(ref_node)
@@ -9,7 +9,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from enum import Enum
 from pathlib import Path
 
 import pytest
@@ -22,33 +21,32 @@ from tests.shared.paths import TEST_ROOT
 DATA_ROOT = TEST_ROOT / "common" / "data" / "reference_graphs"
 
 
-class TestModes(Enum):
-    VALID = "valid"
-    WRONG_TENSOR_SHAPE = "wrong_dropout_node"
-    WRONG_PARALLEL_EDGES = "wrong_parallel_edges"
+VALID = "valid"
+WRONG_TENSOR_SHAPE = "wrong_dropout_node"
+WRONG_PARALLEL_EDGES = "wrong_parallel_edges"
 
 
-@pytest.mark.parametrize("mode", [TestModes.VALID, TestModes.WRONG_TENSOR_SHAPE, TestModes.WRONG_PARALLEL_EDGES])
-def test_remove_nodes_and_reconnect_graph(mode: TestModes):
+@pytest.mark.parametrize("mode", [VALID, WRONG_TENSOR_SHAPE, WRONG_PARALLEL_EDGES])
+def test_remove_nodes_and_reconnect_graph(mode: str):
     def _check_graphs(dot_file_name, nncf_graph) -> None:
         nx_graph = nncf_graph.get_graph_for_structure_analysis()
         path_to_dot = DATA_ROOT / dot_file_name
         compare_nx_graph_with_reference(nx_graph, path_to_dot, check_edge_attrs=True)
 
-    dot_reference_path_before = Path("passes") / "dropout_synthetic_model_before.dot"
-    dot_reference_path_after = Path("passes") / "dropout_synthetic_model_after.dot"
     dropout_metatype = "DROPOUT_METATYPE"
     kwargs = {}
-    if mode != TestModes.VALID:
-        kwargs.update({mode.value: True})
+    if mode != VALID:
+        kwargs.update({mode: True})
 
     nncf_graph = NNCFGraphDropoutRemovingCase(dropout_metatype, **kwargs).nncf_graph
 
-    if mode != TestModes.VALID:
+    if mode != VALID:
         with pytest.raises(AssertionError):
             remove_nodes_and_reconnect_graph(nncf_graph, [dropout_metatype])
         return
 
+    dot_reference_path_before = Path("passes") / "dropout_synthetic_model_before.dot"
+    dot_reference_path_after = Path("passes") / "dropout_synthetic_model_after.dot"
     _check_graphs(dot_reference_path_before, nncf_graph)
     remove_nodes_and_reconnect_graph(nncf_graph, [dropout_metatype])
     _check_graphs(dot_reference_path_after, nncf_graph)
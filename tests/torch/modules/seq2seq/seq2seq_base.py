@@ -9,12 +9,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Any, NamedTuple
+
+import torch
 from torch import nn
-from torch.nn.functional import log_softmax
 
 PAD = 0
 
 
+class GeneratorOutput(NamedTuple):
+    """
+    Output of a single Seq2Seq.generate step.
+
+    :param words: Indices of topK tokens.
+    :param logprobs: Log probabilities of topK tokens.
+    :param scores: Scores from the attention module (for coverage penalty).
+    :param new_context: New decoder context, includes new hidden states for decoder RNN cells.
+    """
+
+    words: torch.Tensor
+    logprobs: torch.Tensor
+    scores: torch.Tensor
+    new_context: Any
+
+
 class Seq2Seq(nn.Module):
     """
     Generic Seq2Seq module, with an encoder and a decoder.
@@ -58,14 +76,16 @@ class Seq2Seq(nn.Module):
     def generate(self, inputs, context, beam_size):
         """
         Autoregressive generator, works with SequenceGenerator class.
-        Executes decoder (in inference mode), applies log_softmax and topK for
-        inference with beam search decoding.
+        Executes decoder (in inference mode) and selects topK tokens with their
+        log probabilities for inference with beam search decoding. topK is taken
+        on the logits, which are ordered the same way as their log_softmax, and
+        the selected logits are normalized by subtracting logsumexp of the logits.
 
         :param inputs: tensor with inputs to the decoder
         :param context: context from the encoder
         :param beam_size: beam size for the generator
 
-        returns: (words, logprobs, scores, new_context)
+        returns: GeneratorOutput(words, logprobs, scores, new_context)
             words: indices of topK tokens
             logprobs: log probabilities of topK tokens
             scores: scores from the attention module (for coverage penalty)
@@ -73,9 +93,14 @@ class Seq2Seq(nn.Module):
                 decoder RNN cells
         """
         logits, scores, new_context = self.decode(inputs, context, True)
-        logprobs = log_softmax(logits, dim=-1)
-        logprobs, words = logprobs.topk(beam_size, dim=-1)
-        return words, logprobs, scores, new_context
+        if beam_size == 1:
+            # Greedy decoding
+            words = logits.argmax(dim=-1, keepdim=True)
+            logits_topk = logits.gather(-1, words)
+        else:
+            logits_topk, words = logits.topk(beam_size, dim=-1)
+        logprobs = logits_topk - torch.logsumexp(logits, dim=-1, keepdim=True)
+        return GeneratorOutput(words, logprobs, scores, new_context)
 
     def forward(self, input_encoder, input_enc_len, input_decoder):
         raise NotImplementedError
@@ -0,0 +1,67 @@
+# Copyright (c) 2023 Intel Corporation
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#      http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+from torch import nn
+from torch.nn.functional import log_softmax
+
+from tests.torch.modules.seq2seq.seq2seq_base import GeneratorOutput
+from tests.torch.modules.seq2seq.seq2seq_base import Seq2Seq
+
+
+class LogitsDecoder(nn.Module):
+    """
+    Decoder stub that returns its inputs as logits.
+    """
+
+    def forward(self, inputs, context, inference):
+        return inputs, inputs.sum(dim=-1), context
+
+
+@pytest.mark.parametrize("beam_size", [1, 4])
+def test_generate_matches_log_softmax_topk(beam_size):
+    torch.manual_seed(0)
+    logits = torch.randn(2, 3, 32)
+    model = Seq2Seq(decoder=LogitsDecoder())
+
+    words, logprobs, _, _ = model.generate(logits, None, beam_size)
+
+    ref_logprobs, ref_words = log_softmax(logits, dim=-1).topk(beam_size, dim=-1)
+    assert torch.equal(words, ref_words)
+    assert torch.allclose(logprobs, ref_logprobs, atol=1e-6)
+
+
+def test_generate_greedy_selects_first_max_on_ties():
+    logits = torch.tensor([[[0.0, 2.0, 2.0, 1.0], [3.0, 1.0, 3.0, 3.0]]])
+    model = Seq2Seq(decoder=LogitsDecoder())
+
+    words, logprobs, _, _ = model.generate(logits, None, 1)
+
+    assert words.tolist() == [[[1], [0]]]
+    ref_logprobs = log_softmax(logits, dim=-1).gather(-1, words)
+    assert torch.allclose(logprobs, ref_logprobs, atol=1e-6)
+
+
+def test_generate_returns_named_output():
+    torch.manual_seed(0)
+    logits = torch.randn(2, 3, 8)
+    context = [torch.zeros(1)]
+    model = Seq2Seq(decoder=LogitsDecoder())
+
+    output = model.generate(logits, context, 2)
+
+    assert isinstance(output, GeneratorOutput)
+    ref_logprobs, ref_words = log_softmax(logits, dim=-1).topk(2, dim=-1)
+    assert torch.equal(output.words, ref_words)
+    assert torch.allclose(output.logprobs, ref_logprobs, atol=1e-6)
+    assert torch.equal(output.scores, logits.sum(dim=-1))
+    assert output.new_context is context
@@ -8,7 +8,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict, List, Type
+from typing import Dict, Tuple, Type
 
 from nncf.common.graph.operator_metatypes import INPUT_NOOP_METATYPES
 from nncf.common.graph.operator_metatypes import OUTPUT_NOOP_METATYPES
@@ -27,7 +27,7 @@ from tests.common.quantization.mock_graphs import get_randomly_connected_model_g
 def test_set_quantization_traits_for_quant_prop_graph_nodes():
     # Test all patchable metatypes. If a patchable metatype is not registered
     # in quantization trait-to-metatype dict, the test will fail.
-    tested_op_metatypes: List[Type[OperatorMetatype]] = get_operator_metatypes()
+    tested_op_metatypes: Tuple[Type[OperatorMetatype], ...] = get_operator_metatypes()
     tested_op_names = set()
     for op_meta in tested_op_metatypes:
         if op_meta not in INPUT_NOOP_METATYPES and op_meta not in OUTPUT_NOOP_METATYPES:
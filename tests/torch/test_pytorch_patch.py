@@ -20,6 +20,9 @@ from nncf.torch.dynamic_graph.patch_pytorch import MagicFunctionsToPatch
 from nncf.torch.dynamic_graph.trace_tensor import TensorMeta
 from nncf.torch.dynamic_graph.trace_tensor import TracedTensor
 from nncf.torch.graph.operator_metatypes import PT_OPERATOR_METATYPES
+from nncf.torch.graph.operator_metatypes import PTOperatorMetatype
+from nncf.torch.graph.operator_metatypes import PTOperatorMetatypeRegistry
+from nncf.torch.graph.operator_metatypes import PTOperatorSubtype
 from tests.shared.isolation_runner import run_pytest_case_function_in_separate_process
 from tests.torch.helpers import BasicConvTestModel
 from tests.torch.helpers import create_compressed_model_and_algo_for_test
@@ -40,6 +43,31 @@ def test_get_all_aliases_is_valid():
     assert not invalid_metatypes, f"There are metatypes with invalid `get_all_aliaces` method: {invalid_metatypes}"
 
 
+def test_operator_metatype_registry_caches_are_reset_on_registration():
+    registry = PTOperatorMetatypeRegistry("test_operator_metatypes")
+
+    @registry.register()
+    class FirstMetatype(PTOperatorMetatype):
+        name = "first"
+        external_op_names = ("first",)
+
+    assert registry.get_operator_metatypes() == (FirstMetatype,)
+    assert not registry.get_metatypes_with_subtypes()
+
+    class SecondSubtype(PTOperatorSubtype):
+        name = "second_subtype"
+        external_op_names = ("second",)
+
+    @registry.register()
+    class SecondMetatype(PTOperatorMetatype):
+        name = "second"
+        external_op_names = ("second",)
+        subtypes = (SecondSubtype,)
+
+    assert registry.get_operator_metatypes() == (FirstMetatype, SecondMetatype)
+    assert registry.get_metatypes_with_subtypes() == frozenset([SecondMetatype])
+
+
 def test_are_all_magic_functions_patched():
     for operator in PT_OPERATOR_METATYPES.registry_dict:
         for function_name in PT_OPERATOR_METATYPES.get(operator).get_all_aliases():